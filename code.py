@@ -9,7 +9,9 @@ from onionpad import modes, OnionPad
 if __name__ == "__main__":
     app = OnionPad()
     app.set_default_mode(modes.BaseMode)
-    app.register_mode(modes.AmbientMode)
-    app.register_mode(modes.HotkeyMapMode)
-    app.register_mode(modes.MediaMode)
+    app.register_modes(
+        modes.AmbientMode,
+        modes.HotkeyMapMode,
+        modes.MediaMode,
+    )
     app.run()
@@ -18,20 +18,41 @@
 
 """Animations for the OLED display of the macropad."""
 
-import math
+from array import array
 from displayio import Group, OnDiskBitmap, TileGrid
-from adafruit_display_shapes.circle import Circle
+from micropython import const
 
 from .assets import Icons
 
+_STEPS = const(16)
+"""The number of frames of the loading circle animation."""
+_STEPS_PER_TILE = const(4)
+"""The number of frames per tile of the loading circle animation."""
+_TILES = const(4)
+"""The number of TileGrids of the loading circle animation."""
+
 
 class Animation(Group):
     """Base class for animations on the OLED display."""
 
-    # pylint: disable-next=unused-argument
     def update(self, progress: float) -> bool:
         """Updates the animation to the given progress.
 
+        Hidden animations are not updated at all.
+
+        :param progress: The progress of the animation between 0 and 1
+        :returns: Whether the animation has changed and the display should
+                  be refreshed.
+        """
+        if self.hidden:
+            return False
+
+        return self._update(progress)
+
+    # pylint: disable-next=unused-argument
+    def _update(self, progress: float) -> bool:
+        """Applies the given progress to the animation.
+
         :param progress: The progress of the animation between 0 and 1
         :returns: Whether the animation has changed and the display should
                   be refreshed.
@@ -42,63 +63,84 @@ class Animation(Group):
 class LoadingCircle(Animation):
     """A loading animation with a circular arc in the center of the display."""
 
-    _POSITIONS = (
-        (32, 40),
-        (32, 64),
-        (8, 64),
-        (8, 40),
+    # The vertical positions must stay multiples of 8, the page size of the
+    # OLED controller.  Page aligned dirty rectangles let the driver push a
+    # frame as one contiguous burst instead of splitting it per page.
+    _POSITIONS = array("B", (32, 40, 32, 64, 8, 64, 8, 40))
+    """The x and y position pairs of the TileGrids of the animations on the
+    display, flattened into a single byte array.
+    """
+    _ROTATIONS = (
+        (False, False, False),
+        (False, True, True),
+        (True, True, False),
+        (True, False, True),
     )
-    """The positions of the TileGrids of the animations on the display."""
-    _STEPS = 16
-    """The number of frames of the animation."""
-    _STEPS_PER_TILE = 4
-    """The number of frames per tile."""
-    _TILES = 4
-    """The number of TileGrids."""
+    """The flip_x, flip_y and transpose_xy flags for each TileGrid."""
+    _FRAME_TABLE = tuple(
+        tuple(
+            (
+                _STEPS_PER_TILE - 1
+                if tile < step // _STEPS_PER_TILE
+                else (step % _STEPS_PER_TILE if tile == step // _STEPS_PER_TILE else -1)
+            )
+            for tile in range(_TILES)
+        )
+        for step in range(_STEPS + 1)
+    )
+    """The frame of each TileGrid for every step of the animation.
+    A frame of -1 hides the TileGrid.
+    """
 
     def __init__(self) -> None:
         super().__init__(x=0, y=0)
         self._bitmap = Icons.loading_circle()
+        self._last_progress = -1
         self._tiles: list[TileGrid] = []
+        background = Icons.loading_bg()
         self.append(
-            Circle(
-                fill=0x000000,
-                r=25,
-                x0=32,
-                y0=64,
+            TileGrid(
+                bitmap=background,
+                pixel_shader=background.pixel_shader,
+                x=7,
+                y=39,
             )
         )
-        for i in range(self._TILES):
+        for i in range(_TILES):
             self._add_tile(i)
 
-    def update(self, progress: float) -> bool:
+    def _update(self, progress: float) -> bool:
         """Set the current progress of the animation.
 
         :param progress: The current progress between 0 and 1.
         """
+        # Equivalent to math.ceil without the function call and the float
+        # result.
+        scaled = _STEPS * progress
+        step = int(scaled)
+        if step < scaled:
+            step += 1
+        if step == self._last_progress:
+            return False
+        self._last_progress = step
+        step = min(step, _STEPS)
         change = False
-        progress = math.ceil(self._STEPS * progress)
-        full_tiles = progress // self._STEPS_PER_TILE
-        partial_tile_progress = progress % self._STEPS_PER_TILE
-        for i in range(self._TILES):
-            if i < full_tiles:
-                if self._tiles[i].hidden:
-                    change = True
-                self._tiles[i].hidden = False
-                if self._tiles[i][0] != self._STEPS_PER_TILE - 1:
+        tiles = self._tiles
+        frames = self._FRAME_TABLE[step]
+        for i in range(_TILES):
+            tile = tiles[i]
+            frame = frames[i]
+            if frame < 0:
+                if not tile.hidden:
+                    tile.hidden = True
                     change = True
-                self._tiles[i][0] = self._STEPS_PER_TILE - 1
-            elif i == full_tiles:
-                if self._tiles[i].hidden:
-                    change = True
-                self._tiles[i].hidden = False
-                self._tiles[i][0] = partial_tile_progress
-                if self._tiles[i][0] != partial_tile_progress:
-                    change = True
-            else:
-                if not self._tiles[i].hidden:
-                    change = True
-                self._tiles[i].hidden = True
+                continue
+            if tile.hidden:
+                tile.hidden = False
+                change = True
+            if tile[0] != frame:
+                tile[0] = frame
+                change = True
 
         return change
 
@@ -107,7 +149,8 @@ class LoadingCircle(Animation):
 
         :param index: The index of the new tile between 0 and _TILES.
         """
-        left, top = self._POSITIONS[index]
+        left = self._POSITIONS[2 * index]
+        top = self._POSITIONS[2 * index + 1]
         tile = TileGrid(
             bitmap=self._bitmap,
             pixel_shader=self._bitmap.pixel_shader,
@@ -126,29 +169,22 @@ class LoadingCircle(Animation):
 
         :param index: The index of the TileGrid.
         """
-        if index == 0:
-            self._tiles[index].flip_x = False
-            self._tiles[index].flip_y = False
-            self._tiles[index].transpose_xy = False
-        elif index == 1:
-            self._tiles[index].flip_x = False
-            self._tiles[index].flip_y = True
-            self._tiles[index].transpose_xy = True
-        elif index == 2:
-            self._tiles[index].flip_x = True
-            self._tiles[index].flip_y = True
-            self._tiles[index].transpose_xy = False
-        else:
-            self._tiles[index].flip_x = True
-            self._tiles[index].flip_y = False
-            self._tiles[index].transpose_xy = True
+        flip_x, flip_y, transpose_xy = self._ROTATIONS[index]
+        tile = self._tiles[index]
+        tile.flip_x = flip_x
+        tile.flip_y = flip_y
+        tile.transpose_xy = transpose_xy
 
 
 class TileAnimation(Animation):
-    """
-    :param position:
-    :param source:
-    :param tile_size:
+    """An animation that cycles through the tiles of a bitmap.
+
+    :param position: Horizontal and vertical position within the parent.
+    :param source: The bitmap with the frames of the animation.
+                   Callers should pass a shared bitmap - for example from
+                   :class:`onionpad.assets.Icons`, which caches loaded
+                   bitmaps - instead of opening a new one per animation.
+    :param tile_size: The width and height of a single frame.
     """
 
     def __init__(
@@ -171,15 +207,20 @@ class TileAnimation(Animation):
         self.append(self._tile_grid)
         columns = source.width // tile_size[0]
         rows = source.height // tile_size[1]
-        self._frames = columns * rows
+        # Stored as float to avoid an int coercion in the multiplication with
+        # the progress on every update.
+        self._frames = float(columns * rows)
+        self._last_frame = -1
 
-    def update(self, progress: float) -> bool:
+    def _update(self, progress: float) -> bool:
         """
         :param progress:
         :returns:
         """
         new_frame = int(self._frames * progress)
-        changed = self._tile_grid[0] != new_frame
+        if new_frame == self._last_frame:
+            return False
+        self._last_frame = new_frame
         self._tile_grid[0] = new_frame
 
-        return changed
+        return True
@@ -49,6 +49,8 @@ class _FileFinder(str):
         subfinders: dict | None = None,
     ):
         self._basepath = basepath
+        self._bitmap: OnDiskBitmap | None = None
+        self._finder_cache: dict = {}
         self._postfix = postfix
         if subfinders is None:
             subfinders = {}
@@ -56,14 +58,19 @@ class _FileFinder(str):
 
     def __call__(self) -> OnDiskBitmap:
         """
-        :returns: A bitmap of the file.
+        :returns: A bitmap of the file. The bitmap is loaded on the first call
+                  and shared between all subsequent calls.
         """
-        bitmap = OnDiskBitmap(str(self))
-        bitmap.pixel_shader.make_transparent(0)
+        if self._bitmap is None:
+            self._bitmap = OnDiskBitmap(str(self))
+            self._bitmap.pixel_shader.make_transparent(0)
 
-        return bitmap
+        return self._bitmap
 
     def __getattr__(self, name: str) -> "_FileFinder":
+        finder = self._finder_cache.get(name)
+        if finder is not None:
+            return finder
         if name in self._subfinders:
             return self._subfinders[name]
         path = self._basepath + name + self._postfix
@@ -73,8 +80,10 @@ class _FileFinder(str):
             raise AttributeError(
                 f"No attribute `{name}`. File '{path}' does not exist"
             ) from exception
+        finder = _FileFinder(path)
+        self._finder_cache[name] = finder
 
-        return _FileFinder(path)
+        return finder
 
     def __str__(self):
         return self._basepath
@@ -21,7 +21,7 @@ them with objects.
 """
 
 try:
-    from typing import Dict, Tuple
+    from typing import Tuple
 except ImportError as _:
     pass
 
@@ -30,8 +30,11 @@ import random
 
 from adafruit_hid import consumer_control_code, keycode, mouse
 
+_TWO_PI = 2 * math.pi
+"""A full rotation in radians, precomputed once at import."""
 
-class _Code:
+
+class _Code:  # pylint: disable=too-few-public-methods
     """Simple dataclass for wrapping consumer control or key codes.
     Can be use to check with `ininstance(code, ...)` if a code should be send as
     normal key press or consumer control key press.
@@ -39,23 +42,29 @@ class _Code:
     :param code: the code wrapped by this object.
     """
 
+    __slots__ = ("code", "_release_twin", "release")
+
     def __init__(self, code: int):
-        self._code = code
+        # The code is exposed as plain attribute and read-only by convention.
+        # A property would add a descriptor dispatch to every HID send.
+        self.code = code
+        self._release_twin = None
         self.release = False
 
-    @property
-    def code(self) -> int:
-        """
-        :returns: The key or consumer control code.
-        """
-        return self._code
-
     def __neg__(self):
         """Implement negation to mark a consumer control or keycode as release
         of the key instead of a press.
+
+        The negated counterpart is created once and cached, so press and
+        release pairs share two persistent objects instead of allocating a
+        fresh one per keystroke.
         """
-        negated = type(self)(self._code)
-        negated.release = not self.release
+        negated = self._release_twin
+        if negated is None:
+            negated = type(self)(self.code)
+            negated.release = not self.release
+            negated._release_twin = self  # pylint: disable=protected-access
+            self._release_twin = negated
 
         return negated
 
@@ -63,16 +72,22 @@ class _Code:
 class ConsumerControl(_Code):  # pylint: disable=too-few-public-methods
     """Check with `isinstance(code, ConsumerControlCode)`"""
 
+    __slots__ = ()
+
 
 class Key(_Code):  # pylint: disable=too-few-public-methods
     """Check with `isinstance(code, KeyCode)`"""
 
+    __slots__ = ()
+
 
 class MouseClick(_Code):  # pylint: disable=too-few-public-methods
     """Check with `isinstance(code, MouseClick)`"""
 
+    __slots__ = ()
+
 
-class MouseMove:
+class MouseMove:  # pylint: disable=too-few-public-methods
     """Dataclass for mouse movements.
     tracks differences in the position and wheel movement.
 
@@ -81,31 +96,12 @@ class MouseMove:
     :param delta_wheel: The movement of the mouse wheel.
     """
 
-    def __init__(self, delta_x: int = 0, delta_y: int = 0, delta_wheel: int = 0):
-        self._delta_x = delta_x
-        self._delta_y = delta_y
-        self._delta_wheel = delta_wheel
-
-    @property
-    def delta_x(self) -> int:
-        """
-        :returns: The movement on the horizontal axis.
-        """
-        return self._delta_x
-
-    @property
-    def delta_y(self) -> int:
-        """
-        :returns: The movement on the vertical axis.
-        """
-        return self._delta_y
+    __slots__ = ("delta_x", "delta_y", "delta_wheel")
 
-    @property
-    def delta_wheel(self) -> int:
-        """
-        :returns: The movement of the mouse wheel.
-        """
-        return self._delta_wheel
+    def __init__(self, delta_x: int = 0, delta_y: int = 0, delta_wheel: int = 0):
+        self.delta_x = delta_x
+        self.delta_y = delta_y
+        self.delta_wheel = delta_wheel
 
 
 class _CodeWrapper:  # pylint: disable=too-few-public-methods
@@ -122,12 +118,19 @@ class _CodeWrapper:  # pylint: disable=too-few-public-methods
 
     def __init__(self, code_provider, code_class: type[_Code]):
         self._provider = code_provider
-        self._cache: Dict[str, ConsumerControl | Key | MouseClick] = {}
         self._code_class = code_class
+        # Wrap all constants of the provider up front.  This trades a one-time
+        # allocation at startup - while the heap is still unfragmented - for
+        # deterministic timing later, instead of allocating wrappers lazily
+        # during the first key press of each kind.
+        for name in dir(code_provider):
+            if name.startswith("_"):
+                continue
+            code = getattr(code_provider, name)
+            if isinstance(code, int):
+                setattr(self, name, code_class(code))
 
     def __getattr__(self, name: str) -> ConsumerControl | Key | MouseClick:
-        if name in self._cache:
-            return self._cache[name]
         code = getattr(self._provider, name, None)
         if code is None:
             if isinstance(self._provider, type):
@@ -138,7 +141,9 @@ class _CodeWrapper:  # pylint: disable=too-few-public-methods
                 f"Object of class `{classname}` has no attribute `{name}`."
             )
         code = self._code_class(code)
-        self._cache[name] = code
+        # Store the wrapped code on the instance, so that future accesses
+        # resolve it directly without entering __getattr__ again.
+        setattr(self, name, code)
 
         return code
 
@@ -154,7 +159,7 @@ Mouse = _CodeWrapper(mouse.Mouse, MouseClick)
 """Wrapper around :class:`adafruit_hid.mouse.Mouse`."""
 
 
-class MouseJiggler:
+class MouseJiggler:  # pylint: disable=too-many-instance-attributes
     """A simple moise jiggler.
 
     The mouse jiggler selects random points and moves the mouse cursor to them.
@@ -168,19 +173,28 @@ class MouseJiggler:
     """
 
     def __init__(self, pixels_per_second: int = 100):
-        self._deviation = random.uniform(0, 2 * math.pi)
-        self._deviation_target = random.uniform(0, 2 * math.pi)
+        self._deviation = random.uniform(0, _TWO_PI)
+        self._deviation_target = random.uniform(0, _TWO_PI)
+        self._cos_deviation = math.cos(self._deviation)
+        self._sin_deviation = math.sin(self._deviation)
+        self._step_trig: dict = {}
         self._pixels_per_second = pixels_per_second
-        self._position: Tuple[int, int] = (0, 0)
+        # The position and target are stored as plain int attributes instead
+        # of tuples, so the hot update path neither indexes nor rebuilds a
+        # tuple per tick.
+        self._position_x = 0
+        self._position_y = 0
         self._sleep = 0.0
-        self._target: Tuple[int, int] = self._get_next_target()
+        self._target_x = 0
+        self._target_y = 0
+        self._choose_next_target()
 
     @property
     def position(self) -> Tuple[int, int]:
         """
         :returns: The mouse pointers position relative to its initial position.
         """
-        return self._position
+        return (self._position_x, self._position_y)
 
     def update(self, delta_t: float) -> Tuple[int, int]:
         """Updates the position of the mouse cursor.
@@ -194,22 +208,26 @@ class MouseJiggler:
             self._sleep -= delta_t
 
             return (0, 0)
-        delta_x = self._target[0] - self._position[0]
-        delta_y = self._target[1] - self._position[1]
-        distance = math.sqrt(abs(delta_x) ** 2 + abs(delta_y) ** 2)
+        delta_x = self._target_x - self._position_x
+        delta_y = self._target_y - self._position_y
+        if delta_x == 0 and delta_y == 0:
+            # Already at the target, skip all the float math below.
+            self._sleep = random.uniform(15, 30)
+            self._choose_next_target()
+
+            return (0, 0)
+        distance = math.sqrt(delta_x * delta_x + delta_y * delta_y)
         pixels = self._pixels_per_second * delta_t
         if pixels >= distance:
             self._sleep = random.uniform(15, 30)
-            self._target = self._get_next_target()
+            self._choose_next_target()
 
             return (delta_x, delta_y)
         deviation = self._update_deviation(delta_t)
         delta_x = round(delta_x * pixels / distance + deviation[0])
         delta_y = round(delta_y * pixels / distance + deviation[1])
-        self._position = (
-            self._position[0] + delta_x,
-            self._position[1] + delta_y,
-        )
+        self._position_x += delta_x
+        self._position_y += delta_y
 
         return (delta_x, delta_y)
 
@@ -222,24 +240,46 @@ class MouseJiggler:
         :returns: The relative change to the mouse position caused by the
                   deviation.
         """
-        deviation_points = self._pixels_per_second * delta_t * 0.5
-        rotation_points = self._pixels_per_second * delta_t * 0.1
+        base = self._pixels_per_second * delta_t
+        deviation_points = base * 0.5
+        rotation_points = base * 0.1
         if abs(self._deviation_target - self._deviation) < rotation_points:
-            self._deviation_target = random.uniform(0, 2 * math.pi)
-        self._deviation += math.copysign(
-            rotation_points, self._deviation_target - self._deviation
+            self._deviation_target = random.uniform(0, _TWO_PI)
+            # Resynchronize the cached sine and cosine, so that rounding
+            # errors of the incremental rotation cannot accumulate forever.
+            self._cos_deviation = math.cos(self._deviation)
+            self._sin_deviation = math.sin(self._deviation)
+        step = (
+            rotation_points
+            if self._deviation_target > self._deviation
+            else -rotation_points
         )
+        self._deviation += step
+        # Rotate the cached (sin, cos) pair by the step with the angle
+        # addition formulas instead of evaluating sin and cos of the full
+        # angle every tick.  The trigonometric values of the quantized step
+        # are memoized, since the tick rate - and with it the step - is
+        # nearly constant.
+        key = round(step, 4)
+        trig = self._step_trig.get(key)
+        if trig is None:
+            trig = (math.sin(key), math.cos(key))
+            if len(self._step_trig) < 32:
+                self._step_trig[key] = trig
+        sin_step, cos_step = trig
+        sin_deviation = self._sin_deviation
+        cos_deviation = self._cos_deviation
+        self._sin_deviation = sin_deviation * cos_step + cos_deviation * sin_step
+        self._cos_deviation = cos_deviation * cos_step - sin_deviation * sin_step
 
         return (
-            (math.cos(self._deviation) - math.sin(self._deviation)) * deviation_points,
-            (math.sin(self._deviation) + math.cos(self._deviation)) * deviation_points,
+            (self._cos_deviation - self._sin_deviation) * deviation_points,
+            (self._sin_deviation + self._cos_deviation) * deviation_points,
         )
 
-    def _get_next_target(self) -> Tuple[int, int]:
+    def _choose_next_target(self) -> None:
+        """Selects the next random point where the mouse cursor should move
+        to.
         """
-        :returns: The next random point where the mouse cursor should move to.
-        """
-        return (
-            random.randint(-50, 50),
-            random.randint(-50, 50),
-        )
+        self._target_x = random.randint(-50, 50)
+        self._target_y = random.randint(-50, 50)
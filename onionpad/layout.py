@@ -24,9 +24,8 @@ try:
 except ImportError as _:
     pass
 
-import math
-
 from adafruit_display_shapes.rect import Rect
+from adafruit_display_text.bitmap_label import Label as BitmapLabel
 from adafruit_display_text.label import Label
 from displayio import Group, OnDiskBitmap, TileGrid
 from terminalio import FONT as builtinFont
@@ -52,9 +51,14 @@ class HotkeyMap(Group):
             y=0,
         )
         self.append(self._background)
-        for _ in range(16):
-            self.append(Group(x=0, y=0))
+        # A Group may only have a single parent, so every cell gets its own
+        # placeholder.  The placeholders are kept around and reused when a
+        # cell is cleared instead of allocating a fresh empty Group each time.
+        self._placeholders = [Group(x=0, y=0) for _ in range(16)]
+        for placeholder in self._placeholders:
+            self.append(placeholder)
         self._images = [[None for _ in range(4)] for _ in range(3)]
+        self._last_images = None
 
     def set_contents(self, images: Iterable[Iterable[OnDiskBitmap]]) -> bool:
         """Update the icons for the hotkeys.
@@ -65,11 +69,16 @@ class HotkeyMap(Group):
         :type images: typing.Iterable[typing.Iterable[~displayio.OnDiskBitmap]]
         :returns: Whether atleast one icon has changed.
         """
+        # The strong reference keeps the last grid alive, so an identity
+        # match can never be a recycled allocation of a discarded grid.
+        if images is self._last_images:
+            return False
         changed = False
         for top, row in enumerate(images):
             for left, icon in enumerate(row):
                 if self.set_icon(left, top, icon):
                     changed = True
+        self._last_images = images
 
         return changed
 
@@ -91,7 +100,8 @@ class HotkeyMap(Group):
             return False
         index = 1 + 4 * top + left
         if icon is None:
-            self[index] = Group(x=0, y=0)
+            self[index] = self._placeholders[index - 1]
+            self._images[top][left] = None
         else:
             self[index] = TileGrid(
                 icon, pixel_shader=icon.pixel_shader, x=1 + 16 * left, y=1 + 16 * top
@@ -101,7 +111,7 @@ class HotkeyMap(Group):
         return True
 
 
-class SelectionLayout(Group):
+class SelectionLayout(Group):  # pylint: disable=too-many-instance-attributes
     """A simple selector to pick a single item out of several elements.
 
     :param positon: Horizontal and vertical position within the parent.
@@ -125,10 +135,18 @@ class SelectionLayout(Group):
         super().__init__(x=position[0], y=position[1])
         self._entries = entries
         self._index = 0
+        self._drawn = False
         self._label_group = Group(x=0, y=0)
+        self._label_texts: List[str] = []
         self._max_labels = max_labels
         # Number of elements actually shown
         self._display_labels = min(max_labels, len(entries))
+        # The window of elements around the selected index only depends on
+        # the number of displayed labels, so it is computed once.  The
+        # integer expressions match floor respectively ceil of half the
+        # label count without going through float division.
+        self._elements_before = self._display_labels // 2 - 1
+        self._elements_after = (self._display_labels + 1) // 2 + 1
         self._init_labels(width)
         self._redraw()
 
@@ -142,6 +160,17 @@ class SelectionLayout(Group):
             return None
         return self._entries[self._index]
 
+    @property
+    def active_index(self) -> int | None:
+        """Access the index of the currently selected item.
+
+        :returns: The index of the selected item or `None` if there are no
+                  items.
+        """
+        if not self._entries:
+            return None
+        return self._index
+
     def next(self) -> str | None:
         """Select the next item.
 
@@ -167,7 +196,7 @@ class SelectionLayout(Group):
         return self.active
 
     def _init_labels(self, width: int) -> None:
-        height = int(width * 1.4)
+        height = (width * 7) // 5
         label_height = 12
         self.append(
             Rect(
@@ -196,14 +225,18 @@ class SelectionLayout(Group):
         self.append(self._label_group)
         entry_count = len(self._entries)
         offset = (self._display_labels - min(entry_count, self._max_labels)) // 2
-        for i in range(entry_count):
+        # Only the visible labels are allocated - _redraw rotates the entries
+        # through them, so the memory use stays bounded by the label count
+        # instead of growing with the number of entries.
+        for i in range(self._display_labels):
             color = 0xFFFFFF
             if i == marker_index:
                 color = 0x000000
+            self._label_texts.append("")
             self._label_group.append(
-                Label(
+                BitmapLabel(
                     anchor_point=(0, 0),
-                    anchored_position=(2, (offset + i) * (height // self._max_labels)),
+                    anchored_position=(2, (offset + i) * label_offset),
                     color=color,
                     font=builtinFont,
                     text="",
@@ -214,17 +247,28 @@ class SelectionLayout(Group):
         if not self._entries:
             return
         entry_count = len(self._entries)
-        elements_before_index = math.floor(self._display_labels / 2) - 1
-        elements_after_index = math.ceil(self._display_labels / 2) + 1
+        # With a single entry every label shows the same text forever, so
+        # anything after the first draw is a no-op.  More populated selectors
+        # scroll their text under the fixed marker and always need the
+        # redraw.
+        if self._drawn and entry_count == 1:
+            return
         elements = [
             self._entries[i % entry_count]
             for i in range(
-                self._index - elements_before_index,
-                self._index + elements_after_index,
+                self._index - self._elements_before,
+                self._index + self._elements_after,
             )
         ]
+        texts = self._label_texts
+        labels = self._label_group
         for i, element in enumerate(elements):
-            self._label_group[i].text = element
+            # Setting Label.text regenerates the glyph bitmap, so a label is
+            # only touched when its string actually changed.
+            if texts[i] != element:
+                labels[i].text = element
+                texts[i] = element
+        self._drawn = True
 
 
 class TitleLayout(Group):
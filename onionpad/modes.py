@@ -27,6 +27,7 @@ except ImportError as _:
 import random
 import time
 
+from array import array
 from displayio import Group
 from .animation import Animation, LoadingCircle, TileAnimation
 from .assets import Icons
@@ -36,6 +37,19 @@ from .onionpad import Mode, OnionPad
 from .util import hsv_to_packed_rgb, LayeredMap
 
 
+def _noop() -> None:
+    """Placeholder action that swallows a key event."""
+    return
+
+
+_EMPTY_ROW = (None, None, None, None)
+"""A shared all-``None`` key row for the static action and icon grids.
+
+The grids are read-only, so every empty row can reference this single
+tuple instead of allocating its own list.
+"""
+
+
 class AmbientMode(Mode):
     """Changes the colors of the NeoPixels continually."""
 
@@ -43,36 +57,65 @@ class AmbientMode(Mode):
 
     def __init__(self, onionpad: OnionPad):
         super().__init__(onionpad)
-        self.keys = [
-            [
-                random.random(),  # Hue in [0, 1]
-                0.2 * random.random() + 0.8,  # Saturation in [0.8, 1]
-                random.choice((-1, 1)) * 0.2 * random.random() + 0.2,
-            ]
-            for _ in range(12)
+        # The per-key state is split into parallel typed arrays instead of a
+        # list of small lists.  The hue lives in a 16 bit phase accumulator
+        # per key, advanced by a fixed signed step each tick.  Wrapping
+        # happens with a bitmask, so the hot loop needs neither a float
+        # multiplication nor a float modulo.  The step assumes the nominal
+        # tick rate of 60 Hz; the resulting cadence jitter is invisible in a
+        # slowly drifting ambient effect.
+        self._phase = array("H", (random.getrandbits(16) for _ in range(12)))
+        saturation = array("f", (0.2 * random.random() + 0.8 for _ in range(12)))
+        self._step = array(
+            "h",
+            (
+                int((random.choice((-1, 1)) * 0.2 * random.random() + 0.2) * 65536 / 60)
+                for _ in range(12)
+            ),
+        )
+        # Saturation and value are fixed per key, so the full hue circle for
+        # every key collapses into a 64 entry table of packed colors.  The
+        # tick then indexes the table instead of converting HSV to RGB in
+        # float math for every key.
+        self._luts = [
+            array(
+                "I",
+                (hsv_to_packed_rgb(j / 64, saturation[i], 0.2) for j in range(64)),
+            )
+            for i in range(12)
         ]
-        self._last_run = 0.0
-
-    def start(self) -> None:
-        self._last_run = time.monotonic()
+        self._last_rgb = array("I", (0 for _ in range(12)))
 
     def pause(self) -> None:
+        self.onionpad.macropad.pixels.fill(0x000000)
+        last_rgb = self._last_rgb
         for i in range(12):
-            self.onionpad.macropad.pixels[i] = 0x000000
+            last_rgb[i] = 0
         self.onionpad.schedule_pixel_refresh()
 
     def tick(self) -> None:
-        now = time.monotonic()
-        delta_t = now - self._last_run
-        self._last_run = now
+        # Attribute accesses are dictionary lookups on CircuitPython, so the
+        # per-key state is bound to locals once instead of being resolved
+        # twelve times per tick.
+        phases = self._phase
+        steps = self._step
+        luts = self._luts
+        last_rgb = self._last_rgb
+        pixels = self.onionpad.macropad.pixels
+        changed = False
         for i in range(12):
-            self.keys[i][0] = (self.keys[i][0] + self.keys[i][2] * delta_t) % 1
-            self.onionpad.macropad.pixels[i] = hsv_to_packed_rgb(
-                self.keys[i][0],
-                self.keys[i][1],
-                0.2,
-            )
-        self.onionpad.schedule_pixel_refresh()
+            phase = (phases[i] + steps[i]) & 0xFFFF
+            phases[i] = phase
+            packed = luts[i][phase >> 10]
+            # With 64 colors per hue circle most ticks land in the same table
+            # entry as the previous one, so unchanged pixels are not written
+            # at all.
+            if packed != last_rgb[i]:
+                last_rgb[i] = packed
+                pixels[i] = packed
+                changed = True
+        if changed:
+            self.onionpad.schedule_pixel_refresh()
 
 
 class BaseMode(Mode):
@@ -83,6 +126,19 @@ class BaseMode(Mode):
     def __init__(self, onionpad: OnionPad):
         super().__init__(onionpad)
         self._layer_icon = Icons.generic.layers()
+        # The action and icon grids never change, so they are built once here
+        # and the properties hand out the stored references instead of
+        # allocating fresh nested lists on every access.
+        self._keydown_actions = [
+            [self._on_layer_select, None, None, None],
+            _EMPTY_ROW,
+            _EMPTY_ROW,
+        ]
+        self._keypad_icons = [
+            [self._layer_icon, None, None, None],
+            _EMPTY_ROW,
+            _EMPTY_ROW,
+        ]
 
     @property
     def title(self) -> str | None:
@@ -90,25 +146,17 @@ class BaseMode(Mode):
 
     @property
     def keydown_actions(self) -> Sequence:
-        return [
-            [self._on_layer_select, None, None, None],
-            [None, None, None, None],
-            [None, None, None, None],
-        ]
+        return self._keydown_actions
 
     @property
     def keypad_icons(self) -> Sequence:
-        return [
-            [self._layer_icon, None, None, None],
-            [None, None, None, None],
-            [None, None, None, None],
-        ]
+        return self._keypad_icons
 
     def _on_layer_select(self):
         self.onionpad.push_mode(PreSelectionMode)
 
 
-class ModeGroup(Mode):
+class ModeGroup(Mode):  # pylint: disable=too-many-instance-attributes
     """Base class for a mode that groups several other modes.
 
     Extend this class and fill the :attr:`MODES` class attribute to create a
@@ -143,6 +191,18 @@ class ModeGroup(Mode):
             self._modes.append(mode)
             if mode.group:
                 self._layer.append(mode.group)
+        # Most modes inherit the empty default hooks from Mode.  Filtering
+        # them out once here keeps the per-frame loop from calling a no-op
+        # method on every sub-mode.
+        self._starting = tuple(
+            mode for mode in self._modes if type(mode).start is not Mode.start
+        )
+        self._pausing = tuple(
+            mode for mode in self._modes if type(mode).pause is not Mode.pause
+        )
+        self._ticking = tuple(
+            mode for mode in self._modes if type(mode).tick is not Mode.tick
+        )
 
     @property
     def group(self) -> Group | None:
@@ -169,15 +229,15 @@ class ModeGroup(Mode):
         return self.NAME
 
     def start(self) -> None:
-        for mode in self._modes:
+        for mode in self._starting:
             mode.start()
 
     def pause(self) -> None:
-        for mode in self._modes:
+        for mode in self._pausing:
             mode.pause()
 
     def tick(self) -> None:
-        for mode in self._modes:
+        for mode in self._ticking:
             mode.tick()
 
 
@@ -189,13 +249,22 @@ class HotkeyMapMode(Mode):
     def __init__(self, onionpad: OnionPad):
         super().__init__(onionpad)
         self._layer = HotkeyMap((0, 40))
+        self._last_generation = None
 
     @property
     def group(self) -> Group | None:
         return self._layer
 
     def tick(self) -> None:
-        if self._layer.set_contents(self.onionpad.keypad_icons):
+        # The icon grid only changes when a mode is pushed or popped, so the
+        # generation counter of the icon map is enough to skip the
+        # cell-by-cell diff in the layer on steady-state frames.
+        generation = self.onionpad.keypad_icons_generation
+        if generation == self._last_generation:
+            return
+        self._last_generation = generation
+        icons = self.onionpad.keypad_icons
+        if self._layer.set_contents(icons):
             self.onionpad.schedule_display_refresh()
 
 
@@ -206,41 +275,41 @@ class MediaMode(Mode):
 
     def __init__(self, onionpad: OnionPad):
         super().__init__(onionpad)
-        self._icons = {
-            "next": Icons.generic.next(),
-            "play": Icons.generic.play_pause(),
-            "previous": Icons.generic.previous(),
-            "stop": Icons.generic.stop(),
-        }
-
-    @property
-    def keydown_actions(self) -> Sequence:
-        return [
-            [None, None, None, None],
+        # The icons are only needed to fill the grid below, ordered like the
+        # keys of the middle row.  A tuple spliced into the grid avoids a
+        # string keyed dictionary that would be hashed on every access.
+        self._icons = (
+            Icons.generic.previous(),
+            Icons.generic.play_pause(),
+            Icons.generic.stop(),
+            Icons.generic.next(),
+        )
+        self._keydown_actions = [
+            _EMPTY_ROW,
             [
                 ConsumerControlCode.SCAN_PREVIOUS_TRACK,
                 ConsumerControlCode.PLAY_PAUSE,
                 ConsumerControlCode.STOP,
                 ConsumerControlCode.SCAN_NEXT_TRACK,
             ],
-            [None, None, None, None],
+            _EMPTY_ROW,
         ]
+        self._keypad_icons = [
+            _EMPTY_ROW,
+            list(self._icons),
+            _EMPTY_ROW,
+        ]
+
+    @property
+    def keydown_actions(self) -> Sequence:
+        return self._keydown_actions
 
     @property
     def keypad_icons(self) -> Sequence:
-        return [
-            [None, None, None, None],
-            [
-                self._icons["previous"],
-                self._icons["play"],
-                self._icons["stop"],
-                self._icons["next"],
-            ],
-            [None, None, None, None],
-        ]
+        return self._keypad_icons
 
 
-class MouseJigglerMode(Mode):
+class MouseJigglerMode(Mode):  # pylint: disable=too-many-instance-attributes
     """Simulates mouse movement to the host."""
 
     _DURATION = 1.0
@@ -258,9 +327,25 @@ class MouseJigglerMode(Mode):
         self._layer.append(TileAnimation((40, 17), bitmap_running, (20, 15)))
         self._layer.append(TileAnimation((40, 17), bitmap_sleeping, (20, 15)))
         self._layer[0].hidden = True
+        # The animations indexed by the active flag: entry 0 is the sleeping
+        # mouse, entry 1 the running one.
+        self._anims = (self._layer[1], self._layer[0])
         self._mouse_icon = bitmap_mouse
         self._mouse_jiggler = MouseJiggler()
         self._start = 0.0
+        # Multiplying with the precomputed inverse saves a float division
+        # per frame.
+        self._inv_duration = 1.0 / self._DURATION
+        self._keydown_actions = [
+            [None, None, None, self._toggle_jiggle],
+            _EMPTY_ROW,
+            _EMPTY_ROW,
+        ]
+        self._keypad_icons = [
+            [None, None, None, self._mouse_icon],
+            _EMPTY_ROW,
+            _EMPTY_ROW,
+        ]
 
     @property
     def group(self) -> Group:
@@ -268,43 +353,34 @@ class MouseJigglerMode(Mode):
 
     @property
     def keydown_actions(self) -> Sequence:
-        return [
-            [None, None, None, self._toggle_jiggle],
-            [None, None, None, None],
-            [None, None, None, None],
-        ]
+        return self._keydown_actions
 
     @property
     def keypad_icons(self) -> Sequence:
-        return [
-            [None, None, None, self._mouse_icon],
-            [None, None, None, None],
-            [None, None, None, None],
-        ]
+        return self._keypad_icons
 
     def _toggle_jiggle(self):
-        if self._active:
-            # Enter inactive mode
-            self._layer[0].hidden = True
-            self._layer[1].hidden = False
-        else:
-            # Enter active mode
-            self._layer[0].hidden = False
-            self._layer[1].hidden = True
+        # Indexing the precomputed animation pair by the active flag replaces
+        # the branch over both hidden assignments.
+        anims = self._anims
+        anims[self._active].hidden = True
         self._active = not self._active
+        anims[self._active].hidden = False
 
     def start(self):
         self._last_tick = time.monotonic()
         self._start = self._last_tick
 
     def tick(self) -> None:
-        animation: Animation = self.group[0] if self._active else self.group[1]
+        animation: Animation = self._anims[self._active]
         now = time.monotonic()
-        progress = (now - self._start) / self._DURATION
+        progress = (now - self._start) * self._inv_duration
         if self._active:
             delta_x, delta_y = self._mouse_jiggler.update(now - self._last_tick)
             self.onionpad.execute_action(MouseMove(delta_x, delta_y))
-        if animation.update(progress % 1):
+        # progress is non-negative, so subtracting the integer part is a
+        # cheaper fractional part than a float modulo.
+        if animation.update(progress - int(progress)):
             self.onionpad.schedule_display_refresh()
         self._last_tick = now
 
@@ -324,6 +400,14 @@ class PreSelectionMode(Mode):
         super().__init__(onionpad)
         self._start = 0.0
         self._layer = LoadingCircle()
+        # Multiplying with the precomputed inverse saves a float division
+        # per frame.
+        self._inv_duration = 1.0 / self.DURATION
+        self._keyup_actions = [
+            [self._abort, None, None, None],
+            _EMPTY_ROW,
+            _EMPTY_ROW,
+        ]
 
     @property
     def group(self) -> Group:
@@ -331,24 +415,20 @@ class PreSelectionMode(Mode):
 
     @property
     def keyup_actions(self) -> Sequence:
-        return [
-            [self._abort, None, None, None],
-            [None, None, None, None],
-            [None, None, None, None],
-        ]
+        return self._keyup_actions
 
     def start(self):
         self._start = time.monotonic()
 
     def tick(self) -> None:
-        progress = (time.monotonic() - self._start) / self.DURATION
+        progress = (time.monotonic() - self._start) * self._inv_duration
         if progress >= 1:
             self.onionpad.pop_mode(self)
             self.onionpad.push_mode(SelectionMode)
 
             return
-        self.group.update(progress)
-        self.onionpad.schedule_display_refresh()
+        if self.group.update(progress):
+            self.onionpad.schedule_display_refresh()
 
     def _abort(self) -> None:
         self.onionpad.set_mode(None)
@@ -363,13 +443,31 @@ class SelectionMode(Mode):
     def __init__(self, onionpad: OnionPad):
         super().__init__(onionpad)
         display_width = onionpad.macropad.display.width
-        self._modes = {
-            mode.NAME: mode for mode in onionpad.modes if not mode.is_hidden()
-        }
+        # The names and mode classes live in two parallel lists.  The layout
+        # reports the selected index, which resolves the mode class with a
+        # plain list lookup instead of hashing the name into a dictionary.
+        names = []
+        self._mode_classes = []
+        for mode in onionpad.modes:
+            if mode._HIDDEN:  # pylint: disable=protected-access
+                continue
+            names.append(mode.NAME)
+            self._mode_classes.append(mode)
         self._layer = SelectionLayout(
-            entries=list(self._modes.keys()),
+            entries=names,
             width=display_width,
         )
+        self._encoder_actions = [[self._encoder]]
+        self._keydown_actions = [
+            [_noop, None, None, None],
+            _EMPTY_ROW,
+            _EMPTY_ROW,
+        ]
+        self._keyup_actions = [
+            [self._select, None, None, None],
+            _EMPTY_ROW,
+            _EMPTY_ROW,
+        ]
 
     @property
     def group(self) -> Group | None:
@@ -377,23 +475,15 @@ class SelectionMode(Mode):
 
     @property
     def encoder_actions(self) -> Sequence:
-        return [[self._encoder]]
+        return self._encoder_actions
 
     @property
     def keydown_actions(self) -> Sequence:
-        return [
-            [lambda: None, None, None, None],
-            [None, None, None, None],
-            [None, None, None, None],
-        ]
+        return self._keydown_actions
 
     @property
     def keyup_actions(self) -> Sequence:
-        return [
-            [self._select, None, None, None],
-            [None, None, None, None],
-            [None, None, None, None],
-        ]
+        return self._keyup_actions
 
     @property
     def title(self) -> str | None:
@@ -409,6 +499,7 @@ class SelectionMode(Mode):
 
     def _select(self) -> None:
         self.onionpad.pop_mode(self)
-        if self._layer.active not in self._modes:
+        index = self._layer.active_index
+        if index is None:
             return
-        self.onionpad.push_mode(self._modes[self._layer.active])
+        self.onionpad.push_mode(self._mode_classes[index])
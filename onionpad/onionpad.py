@@ -20,7 +20,7 @@
 
 try:
     from collections.abc import Sequence
-    from typing import Dict, List, Type
+    from typing import List, Type
 except ImportError as _:
     pass
 
@@ -28,13 +28,35 @@ import time
 
 from adafruit_macropad import MacroPad
 from displayio import Group
-import keypad
+from micropython import const
 from .hid import _Code, Key, ConsumerControl, MouseClick, MouseMove
 from .layout import TitleLayout
 from .util import LayeredMap
 
+_REFRESH_DISPLAY = const(1)
+"""Bit in the refresh flags that marks the display as outdated."""
+_REFRESH_PIXELS = const(2)
+"""Bit in the refresh flags that marks the NeoPixels as outdated."""
 
-class ActionRunner:
+_HID_CONSUMER_CONTROL = const(1)
+"""Bit in the HID dirty mask for an outstanding consumer control press."""
+_HID_KEYBOARD = const(2)
+"""Bit in the HID dirty mask for an outstanding key press."""
+_HID_MOUSE = const(4)
+"""Bit in the HID dirty mask for an outstanding mouse button press."""
+
+_EMPTY_1X1 = ((None,),)
+"""The shared empty default table for the encoder actions."""
+_EMPTY_4X3 = ((None, None, None, None),) * 3
+"""The shared empty default table for key actions and icons."""
+
+
+def _invoke(action) -> None:
+    """Calls a callable action without arguments."""
+    action()
+
+
+class ActionRunner:  # pylint: disable=too-many-instance-attributes
     """Executes actions for the macropad.
 
     Actions are simple callables or input that is send to the host, for example
@@ -43,8 +65,49 @@ class ActionRunner:
     :param macropad: The macropad instance.
     """
 
+    __slots__ = (
+        "_consumer_control",
+        "_dispatch",
+        "_hid_dirty",
+        "_keyboard",
+        "_keyboard_layout",
+        "_macropad",
+        "_mouse",
+        "_release",
+    )
+
     def __init__(self, macropad: MacroPad):
         self._macropad = macropad
+        # The HID endpoints are resolved once here.  Each of them is a
+        # chained attribute lookup on the macropad, which would otherwise be
+        # repeated on every single send.
+        self._consumer_control = macropad.consumer_control
+        self._keyboard = macropad.keyboard
+        self._keyboard_layout = macropad.keyboard_layout
+        self._mouse = macropad.mouse
+        self._release = (
+            (_HID_CONSUMER_CONTROL, self._consumer_control.release),
+            (_HID_KEYBOARD, self._keyboard.release_all),
+            (_HID_MOUSE, self._mouse.release_all),
+        )
+        # Mask of the subsystems with an outstanding press, maintained by the
+        # handlers below.  The final release only reports to the subsystems
+        # that are actually dirty, so a plain callable, a mouse movement or a
+        # string costs no release reports at all - the keyboard layout
+        # already releases after every character.
+        self._hid_dirty = 0
+        # Jump table from the exact action type to its handler.  A single
+        # dictionary lookup replaces the isinstance chain that every key
+        # press used to walk.  The action types are final classes, so
+        # dispatching on type() is safe.
+        self._dispatch = {
+            ConsumerControl: self._send_consumer_control,
+            Key: self._send_key,
+            MouseClick: self._send_mouse_click,
+            MouseMove: self._move_mouse,
+            str: self._write,
+            list: self._execute_list,
+        }
 
     def execute_hid_action(self, action: _Code | MouseMove | str) -> None:
         """
@@ -54,26 +117,59 @@ class ActionRunner:
                        If the action is a string, every character of the string
                        will be send as key press to the host.
         """
-        if isinstance(action, ConsumerControl):
-            self._macropad.consumer_control.send(action.code)
-        elif isinstance(action, Key):
-            if action.release:
-                self._macropad.keyboard.release(action.code)
-            else:
-                self._macropad.keyboard.press(action.code)
-        elif isinstance(action, MouseClick):
-            if action.release:
-                self._macropad.mouse.release(action.code)
-            else:
-                self._macropad.mouse.press(action.code)
-        elif isinstance(action, MouseMove):
-            self._macropad.mouse.move(
-                x=action.delta_x,
-                y=action.delta_y,
-                wheel=action.delta_wheel,
-            )
-        elif isinstance(action, str):
-            self._macropad.keyboard_layout.write(action)
+        handler = self._dispatch.get(type(action))
+        if handler is not None:
+            handler(action)
+
+    def _execute_list(self, action: list) -> None:
+        # Nested lists are expanded onto an explicit worklist, so executing a
+        # macro costs one loop instead of a Python call frame per element.
+        # Compiled list actions never reach this handler; it covers lists
+        # passed to execute directly.
+        dispatch = self._dispatch
+        pending = list(action)
+        pending.reverse()
+        while pending:
+            element = pending.pop()
+            if element is None:
+                continue
+            if type(element) is list:  # pylint: disable=unidiomatic-typecheck
+                for item in reversed(element):
+                    pending.append(item)
+                continue
+            handler = dispatch.get(type(element))
+            if handler is not None:
+                handler(element)
+            elif callable(element):
+                element()
+
+    def _move_mouse(self, action: MouseMove) -> None:
+        self._mouse.move(
+            x=action.delta_x,
+            y=action.delta_y,
+            wheel=action.delta_wheel,
+        )
+
+    def _send_consumer_control(self, action: ConsumerControl) -> None:
+        self._hid_dirty |= _HID_CONSUMER_CONTROL
+        self._consumer_control.send(action.code)
+
+    def _send_key(self, action: Key) -> None:
+        self._hid_dirty |= _HID_KEYBOARD
+        if action.release:
+            self._keyboard.release(action.code)
+        else:
+            self._keyboard.press(action.code)
+
+    def _send_mouse_click(self, action: MouseClick) -> None:
+        self._hid_dirty |= _HID_MOUSE
+        if action.release:
+            self._mouse.release(action.code)
+        else:
+            self._mouse.press(action.code)
+
+    def _write(self, action: str) -> None:
+        self._keyboard_layout.write(action)
 
     def execute(
         self,
@@ -99,23 +195,67 @@ class ActionRunner:
                         control functions are released again after the action
                         was executed.
         """
-        if args is None:
-            args = {}
-        if callable(action):
+        if action is None:
+            return
+        handler = self._dispatch.get(type(action))
+        if handler is not None:
+            handler(action)
+        elif callable(action):
+            if args is None:
+                args = {}
             action(**args)
-        elif isinstance(action, (_Code, MouseMove, str)):
-            self.execute_hid_action(action)
-        elif isinstance(action, list):
-            for element in action:
-                self.execute(element, release=False)
         if release:
-            self.release_all()
+            dirty = self._hid_dirty
+            if dirty:
+                self._hid_dirty = 0
+                for bit, release_subsystem in self._release:
+                    if dirty & bit:
+                        release_subsystem()
+
+    def compile(self, action):
+        """Partially evaluates a list action into a single closure.
+
+        The closure captures the flattened sequence of handler and action
+        pairs, so executing it performs pure dispatch without type checks or
+        recursion per element.  Nested lists are flattened, which preserves
+        the execution order of :meth:`execute`.
+
+        :param action: The action to compile.
+        :returns: A closure for list actions, any other action unchanged.
+        """
+        if type(action) is not list:  # pylint: disable=unidiomatic-typecheck
+            return action
+        steps: list = []
+        self._flatten(action, steps)
+
+        def run() -> None:
+            for handler, element in steps:
+                handler(element)
+
+        return run
 
     def release_all(self) -> None:
         """Report all key presses and mouse clicks to the host as released."""
-        self._macropad.consumer_control.release()
-        self._macropad.keyboard.release_all()
-        self._macropad.mouse.release_all()
+        self._hid_dirty = 0
+        for _, release_subsystem in self._release:
+            release_subsystem()
+
+    def _flatten(self, action: list, steps: list) -> None:
+        """Collects the handler and action pairs of a list action.
+
+        :param action: The list action to walk.
+        :param steps: The list the pairs are appended to.
+        """
+        dispatch = self._dispatch
+        for element in action:
+            if type(element) is list:  # pylint: disable=unidiomatic-typecheck
+                self._flatten(element, steps)
+                continue
+            handler = dispatch.get(type(element))
+            if handler is not None:
+                steps.append((handler, element))
+            elif callable(element):
+                steps.append((_invoke, element))
 
 
 class Mode:
@@ -125,12 +265,30 @@ class Mode:
     :param onionPad: The OnionPad instance.
     """
 
+    __slots__ = (
+        "onionpad",
+        "_cached_maps",
+        "_encoder_actions",
+        "_keydown_actions",
+        "_keypad_icons",
+        "_keyup_actions",
+    )
+
     _HIDDEN = False
+    """Whether this mode should be hidden from the user."""
     NAME = "Mode"
     """The name of the mode that will be used in the mode selection."""
 
     def __init__(self, onionpad: "OnionPad"):
         self.onionpad = onionpad
+        self._cached_maps = None
+        # All modes share the frozen empty module level constants instead of
+        # allocating four nested lists per instance.  Subclasses overwrite
+        # the attributes or override the properties.
+        self._encoder_actions = _EMPTY_1X1
+        self._keydown_actions = _EMPTY_4X3
+        self._keypad_icons = _EMPTY_4X3
+        self._keyup_actions = _EMPTY_4X3
 
     @property
     def group(self) -> Group | None:
@@ -139,13 +297,6 @@ class Mode:
         """
         return None
 
-    @classmethod
-    def is_hidden(cls) -> bool:
-        """
-        :returns: Whether this mode should be hidden from the user.
-        """
-        return cls._HIDDEN
-
     @property
     def keydown_actions(self) -> Sequence:
         """
@@ -154,7 +305,7 @@ class Mode:
 
                   See :meth:`ActionRunner.execute` for possible actions.
         """
-        return [[None, None, None, None] for _ in range(3)]
+        return self._keydown_actions
 
     @property
     def keypad_icons(self) -> Sequence:
@@ -162,7 +313,7 @@ class Mode:
         :returns: A 2-dimensional 4x3 list with icons for actions registered
                   by this mode.
         """
-        return [[None, None, None, None] for _ in range(3)]
+        return self._keypad_icons
 
     @property
     def keyup_actions(self) -> Sequence:
@@ -172,7 +323,7 @@ class Mode:
 
                   See :meth:`ActionRunner.execute` for possible actions.
         """
-        return [[None, None, None, None] for _ in range(3)]
+        return self._keyup_actions
 
     @property
     def encoder_actions(self) -> Sequence:
@@ -180,7 +331,7 @@ class Mode:
         :returns: A 2-dimensional 1x1 list with actions that will be executed
                   when the rotatory encoder changes its state.
         """
-        return [[None]]
+        return self._encoder_actions
 
     @property
     def title(self) -> str | None:
@@ -190,6 +341,27 @@ class Mode:
         """
         return None
 
+    def invalidate_maps(self) -> None:
+        """Discards the memoized action and icon tables, so that the next
+        activation evaluates the properties again.
+        """
+        self._cached_maps = None
+
+    def maps(self) -> tuple:
+        """
+        :returns: The encoder actions, keydown actions, keyup actions and
+                  keypad icons as a tuple, evaluated once and memoized.
+        """
+        if self._cached_maps is None:
+            self._cached_maps = (
+                self.encoder_actions,
+                self.keydown_actions,
+                self.keyup_actions,
+                self.keypad_icons,
+            )
+
+        return self._cached_maps
+
     def start(self) -> None:
         """Called when the mode is activated."""
 
@@ -209,14 +381,14 @@ class ModeContainer:
     """
 
     def __init__(self):
-        self._modes: Dict[Type[Mode], Mode] = {}
+        self._modes: List[Type[Mode]] = []
 
     @property
     def modes(self) -> tuple:
         """
         :returns: A tuple with the classes of all modes in the container.
         """
-        return tuple(self._modes.keys())
+        return tuple(self._modes)
 
     def add(self, mode: Mode) -> None:
         """Add a mode to the container.
@@ -228,7 +400,12 @@ class ModeContainer:
         mode_class = type(mode)
         if mode_class in self:
             return
-        self._modes[mode_class] = mode
+        # The instance is memoized directly on the mode class, so lookups are
+        # a plain attribute load instead of hashing the class into a
+        # dictionary.  The list only keeps the registration order for the
+        # modes property.
+        mode_class._onionpad_instance = mode  # pylint: disable=protected-access
+        self._modes.append(mode_class)
 
     def __contains__(self, mode_class: type[Mode]) -> bool:
         """Check if the container has an instance of a specific mode class.
@@ -236,7 +413,11 @@ class ModeContainer:
         :param mode_class: The class whose existence in the container is checked.
         :returns: Whether the container has an instance of that class.
         """
-        return mode_class in self._modes
+        # The exact type check guards against the attribute being inherited
+        # from a registered base class.
+        instance = getattr(mode_class, "_onionpad_instance", None)
+
+        return type(instance) is mode_class  # pylint: disable=unidiomatic-typecheck
 
     def __getitem__(self, mode_class: type[Mode]) -> Mode:
         """Get an instance for a mode class.
@@ -248,31 +429,78 @@ class ModeContainer:
             raise KeyError(
                 f"The modecontainer has no instance of {mode_class.__class__}"
             )
-        return self._modes[mode_class]
+        return mode_class._onionpad_instance
 
 
-class ModeStack:
+# Most attributes are caches that trade RAM for work on the event path.
+class ModeStack:  # pylint: disable=too-many-instance-attributes
     """The stack of all active modes.
 
     :param layout: The title layout of the OnionPad.
+    :param action_runner: The action runner used to precompile list actions.
     """
 
-    def __init__(self, layout: TitleLayout):
+    __slots__ = (
+        "_action_runner",
+        "_active_cache",
+        "_active_modes",
+        "_default_mode",
+        "_effective_keydown",
+        "_effective_keyup",
+        "_encoder_actions",
+        "_keydown_actions",
+        "_keypad_icons",
+        "_keyup_actions",
+        "_layout",
+        "_ticking_cache",
+        "_ticking_modes",
+        "_title_stack",
+    )
+
+    def __init__(self, layout: TitleLayout, action_runner: ActionRunner):
+        self._action_runner = action_runner
+        self._active_cache: tuple | None = None
         self._active_modes: List[Mode] = []
         self._default_mode: Mode | None = None
+        self._effective_keydown: tuple = (None,) * 12
+        self._effective_keyup: tuple = (None,) * 12
         self._encoder_actions = LayeredMap(1, 1)
         self._keydown_actions = LayeredMap(4, 3)
         self._keyup_actions = LayeredMap(4, 3)
         self._keypad_icons = LayeredMap(4, 3)
         self._layout = layout
+        # Parallel stack of (stack index, title) pairs of the modes with a
+        # title.  The effective title is always the top entry, so popping a
+        # mode does not rescan the whole stack.
+        self._title_stack: List[tuple] = []
+        # The subset of the active modes that override Mode.tick, so the main
+        # loop does not call the empty default on every other mode each
+        # frame.
+        self._ticking_cache: tuple | None = None
+        self._ticking_modes: List[Mode] = []
 
     @property
     def active_modes(self) -> tuple:
         """
         :returns: A tuple of the active modes in the reverse order of which
-                  the modes where pushed onto the stack.
+                  the modes where pushed onto the stack.  Cached and only
+                  rebuilt after a mode was pushed or popped.
         """
-        return tuple(reversed(self._active_modes))
+        if self._active_cache is None:
+            self._active_cache = tuple(reversed(self._active_modes))
+
+        return self._active_cache
+
+    @property
+    def ticking_modes(self) -> tuple:
+        """
+        :returns: A tuple of the active modes that override :meth:`Mode.tick`,
+                  in reverse push order.
+        """
+        if self._ticking_cache is None:
+            self._ticking_cache = tuple(reversed(self._ticking_modes))
+
+        return self._ticking_cache
 
     @property
     def encoder_actions(self) -> tuple:
@@ -281,6 +509,22 @@ class ModeStack:
         """
         return self._encoder_actions.immutable
 
+    @property
+    def effective_keydown_actions(self) -> tuple:
+        """
+        :returns: A flat 12 element tuple with the currently effective keydown
+                  action per key number.
+        """
+        return self._effective_keydown
+
+    @property
+    def effective_keyup_actions(self) -> tuple:
+        """
+        :returns: A flat 12 element tuple with the currently effective keyup
+                  action per key number.
+        """
+        return self._effective_keyup
+
     @property
     def keydown_actions(self) -> tuple:
         """
@@ -302,6 +546,14 @@ class ModeStack:
         """
         return self._keypad_icons.immutable
 
+    @property
+    def keypad_icons_generation(self) -> int:
+        """
+        :returns: A counter that increases whenever the icons change.
+                  See :attr:`onionpad.util.LayeredMap.generation`.
+        """
+        return self._keypad_icons.generation
+
     def pop(self, mode: Mode | None = None) -> None:
         """
         Removes a mode from a stack.
@@ -332,15 +584,25 @@ class ModeStack:
         if mode in self._active_modes:
             self._remove_mode(mode)
         mode.start()
+        self._active_cache = None
         self._active_modes.append(mode)
-        if mode.title:
-            self._layout.title = mode.title
-        if mode.group is not None:
-            self._layout.append(mode.group)
-        self._encoder_actions.push_layer(mode.encoder_actions, mode.NAME)
-        self._keydown_actions.push_layer(mode.keydown_actions, mode.NAME)
-        self._keyup_actions.push_layer(mode.keyup_actions, mode.NAME)
-        self._keypad_icons.push_layer(mode.keypad_icons, mode.NAME)
+        if type(mode).tick is not Mode.tick:
+            self._ticking_cache = None
+            self._ticking_modes.append(mode)
+        title = mode.title
+        if title:
+            self._title_stack.append((len(self._active_modes) - 1, title))
+            self._layout.title = title
+        group = mode.group
+        if group is not None:
+            self._layout.append(group)
+        name = mode.NAME
+        encoder_actions, keydown_actions, keyup_actions, keypad_icons = mode.maps()
+        self._encoder_actions.push_layer(encoder_actions, name)
+        self._keydown_actions.push_layer(keydown_actions, name)
+        self._keyup_actions.push_layer(keyup_actions, name)
+        self._keypad_icons.push_layer(keypad_icons, name)
+        self._resolve_actions()
 
     def set_default_mode(self, mode: Mode | None) -> None:
         """Set the default mode to apply if all other modes are removed.
@@ -371,30 +633,77 @@ class ModeStack:
     def _remove_at_top(self) -> None:
         """Removes the most recent mode from the stack."""
         mode = self._active_modes.pop()
+        self._active_cache = None
+        if type(mode).tick is not Mode.tick:
+            self._ticking_cache = None
+            self._ticking_modes.remove(mode)
         mode.pause()
-        if mode.group is not None:
-            self._layout.remove(mode.group)
-        self._encoder_actions.remove_layer(mode.NAME)
-        self._keydown_actions.remove_layer(mode.NAME)
-        self._keypad_icons.remove_layer(mode.NAME)
-        self._keyup_actions.remove_layer(mode.NAME)
-        for active_mode in reversed(self._active_modes):
-            if active_mode.title:
-                self._layout.title = active_mode.title
-                break
-        else:
-            self._layout.title = None
+        group = mode.group
+        if group is not None:
+            self._layout.remove(group)
+        name = mode.NAME
+        self._encoder_actions.remove_layer(name)
+        self._keydown_actions.remove_layer(name)
+        self._keypad_icons.remove_layer(name)
+        self._keyup_actions.remove_layer(name)
+        self._resolve_actions()
+        title_stack = self._title_stack
+        if title_stack and title_stack[-1][0] == len(self._active_modes):
+            title_stack.pop()
+            self._layout.title = title_stack[-1][1] if title_stack else None
+
+    def _resolve_actions(self) -> None:
+        """Flattens the layered key actions into per-key-number tuples.
+
+        Runs once per push or pop, so dispatching a key event is a single
+        index into a flat tuple.  List actions are compiled into closures
+        here, so pressing a macro key performs pure dispatch.
+        """
+        compile_action = self._action_runner.compile
+        self._effective_keydown = tuple(
+            compile_action(action) for action in self._keydown_actions.flat
+        )
+        self._effective_keyup = tuple(
+            compile_action(action) for action in self._keyup_actions.flat
+        )
 
     def _remove_mode(self, mode: Mode) -> None:
         """Removes the given mode (and all modes above it) from the stack.
 
         Has no effect if the mode is not present on the stack.
+
+        All affected modes are torn down in one pass, so the effective
+        actions and the title are recomputed once instead of once per
+        removed mode.
         """
-        if mode not in self._active_modes:
+        try:
+            index = self._active_modes.index(mode)
+        except ValueError:
             return
-        while self._active_modes[-1] != mode:
-            self._remove_at_top()
-        self._remove_at_top()
+        removed_modes = self._active_modes[index:]
+        del self._active_modes[index:]
+        self._active_cache = None
+        self._ticking_cache = None
+        layout = self._layout
+        for removed in reversed(removed_modes):
+            removed.pause()
+            if removed.group is not None:
+                layout.remove(removed.group)
+            name = removed.NAME
+            self._encoder_actions.remove_layer(name)
+            self._keydown_actions.remove_layer(name)
+            self._keypad_icons.remove_layer(name)
+            self._keyup_actions.remove_layer(name)
+            if type(removed).tick is not Mode.tick:
+                self._ticking_modes.remove(removed)
+        self._resolve_actions()
+        title_stack = self._title_stack
+        title_changed = False
+        while title_stack and title_stack[-1][0] >= index:
+            title_stack.pop()
+            title_changed = True
+        if title_changed:
+            layout.title = title_stack[-1][1] if title_stack else None
 
 
 class OLEDSaver:
@@ -403,6 +712,8 @@ class OLEDSaver:
     :param onionpad: The onionpad instance.
     """
 
+    __slots__ = ("_delay", "_last_input", "_macropad", "_sleep")
+
     def __init__(self, macropad: MacroPad):
         self._delay = 30.0
         self._last_input = time.monotonic()
@@ -445,12 +756,20 @@ class OLEDSaver:
         :param user_input: Whether there was any user input after the last call
                            to this method.
         """
-        now = time.monotonic()
+        # The sleep state is known in every branch, so the transitions are
+        # inlined instead of re-checking it through sleep and wakeup.  While
+        # the display sleeps without input, not even the clock is read.
         if user_input:
-            self._last_input = now
-            self.wakeup()
-        elif now - self._last_input > self._delay and not self.is_asleep:
-            self.sleep()
+            self._last_input = time.monotonic()
+            if self._sleep:
+                self._macropad.display_sleep = False
+                self._sleep = False
+            return
+        if self._sleep:
+            return
+        if time.monotonic() - self._last_input > self._delay:
+            self._macropad.display_sleep = True
+            self._sleep = True
 
     def wakeup(self) -> None:
         """Wakes the display up."""
@@ -470,13 +789,13 @@ class OnionPad:
     """
 
     def __init__(self):
+        self._action_runner: ActionRunner = None
         self._encoder_position = 0
         self._macropad: MacroPad = None
         self._mode_container = ModeContainer()
         self._modestack: ModeStack = None
         self._oled_saver: OLEDSaver = None
-        self._should_refresh_display = False
-        self._should_refresh_pixels = False
+        self._refresh_flags = 0
         self._setup_macropad()
 
     @property
@@ -486,6 +805,13 @@ class OnionPad:
         """
         return self._modestack.keypad_icons
 
+    @property
+    def keypad_icons_generation(self) -> int:
+        """
+        :returns: A counter that increases whenever the hotkey icons change.
+        """
+        return self._modestack.keypad_icons_generation
+
     @property
     def macropad(self) -> MacroPad:
         """
@@ -507,7 +833,7 @@ class OnionPad:
         release: bool = True,
     ) -> None:
         """Wrapper around :meth:`ActionRunner.execute`."""
-        ActionRunner(self._macropad).execute(action, args=args, release=release)
+        self._action_runner.execute(action, args=args, release=release)
 
     def pop_mode(self, mode: Mode | None = None) -> None:
         """
@@ -548,6 +874,19 @@ class OnionPad:
         if mode_class not in self._mode_container:
             self._mode_container.add(mode_class(self))
 
+    def register_modes(self, *mode_classes: type[Mode]) -> None:
+        """
+        Register several modes at once, so that they show up in the mode
+        selection.
+
+        :param mode_classes: The classes of the modes that should be
+                             registered.
+        """
+        container = self._mode_container
+        for mode_class in mode_classes:
+            if mode_class not in container:
+                container.add(mode_class(self))
+
     def set_default_mode(self, mode_class: type[Mode] | None) -> None:
         """Set the mode that will be applied when no other mode is active.
 
@@ -584,11 +923,11 @@ class OnionPad:
 
     def schedule_display_refresh(self) -> None:
         """Notify the OnionPad that the display content has changed."""
-        self._should_refresh_display = True
+        self._refresh_flags |= _REFRESH_DISPLAY
 
     def schedule_pixel_refresh(self) -> None:
         """Notify the OnionPad that the NeoPixels have changed."""
-        self._should_refresh_pixels = True
+        self._refresh_flags |= _REFRESH_PIXELS
 
     def run(self) -> None:
         """Starts the OnionPad."""
@@ -596,44 +935,56 @@ class OnionPad:
             self._tick()
 
     def _tick(self) -> None:
+        # The frequently used helpers are bound to locals once per tick, so
+        # the loops below do not repeat the chained attribute lookups.
+        macropad = self._macropad
+        modestack = self._modestack
         user_input = False
-        while self.macropad.keys.events:
+        # The bound get is looked up once; it returns None once the queue is
+        # drained, so the loop neither re-tests the queue nor repeats the
+        # attribute chain per event.
+        keys_events_get = macropad.keys.events.get
+        while True:
+            event = keys_events_get()
+            if event is None:
+                break
             user_input = True
-            self._handle_key_event(self.macropad.keys.events.get())
-        encoder = self.macropad.encoder
+            # The first matching action on the modestack is resolved inline -
+            # a call into a helper per event would cost a Python frame, and
+            # the flat action tuples are indexed by the key number directly.
+            if event.pressed:
+                action = modestack.effective_keydown_actions[event.key_number]
+            else:
+                action = modestack.effective_keyup_actions[event.key_number]
+            # Most cells of the key matrix are unbound, so pressing one of
+            # them costs nothing but this check.
+            if action is not None:
+                self.execute_action(action)
+        encoder = macropad.encoder
         encoder_change = encoder - self._encoder_position
         self._encoder_position = encoder
         if encoder_change:
             user_input = True
             self.execute_action(
-                self._modestack.encoder_actions[0][0],
+                modestack.encoder_actions[0][0],
                 args={"encoder": encoder, "change": encoder_change},
             )
-        # Copy the list of modes to avoid problems with changes to the mode list
-        # during iteration.
-        for mode in self._modestack.active_modes:
+        # The cached tuple keeps the iteration safe against changes to the
+        # mode list during the ticks.
+        for mode in modestack.ticking_modes:
             mode.tick()
-        if self._should_refresh_display:
-            self.macropad.display.refresh()
-            self._should_refresh_display = False
-        if self._should_refresh_pixels:
-            self.macropad.pixels.show()
-            self._should_refresh_pixels = False
+        flags = self._refresh_flags
+        if flags:
+            # The flags are cleared before flushing, so a refresh scheduled
+            # while the display or pixels are being written is not lost but
+            # serviced on the next tick.
+            self._refresh_flags = 0
+            if flags & _REFRESH_DISPLAY:
+                macropad.display.refresh()
+            if flags & _REFRESH_PIXELS:
+                macropad.pixels.show()
         self._oled_saver.tick(user_input)
 
-    def _handle_key_event(self, event: keypad.Event) -> None:
-        """Runs the first action on the modestack that matches a keypad event.
-
-        :param event: The keypad event.
-        """
-        column = event.key_number % 4
-        row = event.key_number // 4
-        if event.pressed:
-            action = self._modestack.keydown_actions[row][column]
-        else:
-            action = self._modestack.keyup_actions[row][column]
-        self.execute_action(action)
-
     def _setup_macropad(self) -> None:
         macropad = MacroPad(rotation=90)
         macropad.display.auto_refresh = False
@@ -643,6 +994,7 @@ class OnionPad:
         macropad.display.show(layout)
         self.schedule_display_refresh()
 
+        self._action_runner = ActionRunner(macropad)
         self._macropad = macropad
-        self._modestack = ModeStack(layout)
+        self._modestack = ModeStack(layout, self._action_runner)
         self._oled_saver = OLEDSaver(macropad)
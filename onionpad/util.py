@@ -20,15 +20,30 @@
 
 try:
     from collections.abc import Sequence
-    from typing import Dict
+    from typing import List
 except ImportError as _:
     pass
 
-from collections import OrderedDict  # pylint: disable=ungrouped-imports
 import os
 
+_HSV_ORDER = (
+    (0, 1, 2),
+    (1, 0, 2),
+    (2, 0, 1),
+    (2, 1, 0),
+    (1, 2, 0),
+    (0, 2, 1),
+    (0, 2, 1),
+)
+"""Component selection per hue sextant for :func:`hsv_to_rgb`.
 
-class LayeredMap:
+Each entry picks one of chroma, supplement or base for the red, green and
+blue channel.  The duplicated last entry serves a hue of exactly 1.0, where
+the supplement is zero and the first and last sextant coincide.
+"""
+
+
+class LayeredMap:  # pylint: disable=too-many-instance-attributes
     """A 2-dimensional structure with multiple layers.
 
     Element access traverses trough the layers from top to bottom and returns
@@ -50,10 +65,36 @@ class LayeredMap:
         print(l[1][1]) # 2
     """
 
+    __slots__ = (
+        "_cache",
+        "_cache_rows",
+        "_generation",
+        "_height",
+        "_layer_data",
+        "_layer_names",
+        "_owner",
+        "_resolved",
+        "_width",
+    )
+
     def __init__(self, width: int, height: int):
+        self._cache: tuple | None = None
+        self._cache_rows: tuple | None = None
+        self._generation = 0
         self._height = height
         self._width = width
-        self._layers: Dict[str, Sequence] = OrderedDict()
+        # The layers are kept as parallel lists of names and flattened
+        # row-major data, bottom to top.  Plain lists guarantee the stacking
+        # order on every port and iterate without materializing a view,
+        # which an ordered dictionary does not.
+        self._layer_data: List[list] = []
+        self._layer_names: List[str] = []
+        # The composed state is maintained incrementally.  For every cell
+        # `_resolved` holds the top-most value and `_owner` the name of the
+        # layer providing it, so adding a layer only overlays its own cells
+        # and removing one only recomposes the cells it owned.
+        self._owner: list = [None] * (width * height)
+        self._resolved: list = [None] * (width * height)
 
     @property
     def width(self) -> int:
@@ -69,12 +110,43 @@ class LayeredMap:
         """
         return self._height
 
+    @property
+    def generation(self) -> int:
+        """
+        :returns: A counter that increases whenever a layer is added or
+                  removed.
+
+        Consumers can remember the last seen generation and skip rebuilding
+        derived state while it is unchanged.
+        """
+        return self._generation
+
+    @property
+    def flat(self) -> tuple:
+        """
+        :returns: A flat tuple of the contents in row-major order.
+
+        The composed view is cached and only rebuilt after a layer was added
+        or removed, so repeated accesses between changes are free.
+        """
+        if self._cache is None:
+            self._cache = tuple(self._resolved)
+
+        return self._cache
+
     @property
     def immutable(self) -> tuple:
         """
         :returns: A tuple of the contents.
         """
-        return tuple(tuple(element for element in row) for row in self)
+        if self._cache_rows is None:
+            flat = self.flat
+            width = self._width
+            self._cache_rows = tuple(
+                flat[i * width : (i + 1) * width] for i in range(self._height)
+            )
+
+        return self._cache_rows
 
     def push_layer(self, layer: Sequence, name: str) -> None:
         """Adds a new layer on top of the map.
@@ -87,31 +159,82 @@ class LayeredMap:
             raise ValueError(
                 "The height of the layer does not match the height of the LayeredMap"
             )
+        flattened = []
         for i, row in enumerate(layer):
             if len(row) != self.width:
                 raise ValueError(
                     f"The width of row {i} of the layer does not match the "
                     "width of the LayeredMap"
                 )
-        self._layers[name] = layer
+            flattened.extend(row)
+        names = self._layer_names
+        if name in names:
+            # Replacing a layer keeps its position in the stack, so the
+            # cheap "new layer wins" overlay below does not apply.
+            self._layer_data[names.index(name)] = flattened
+            self._recompose()
+        else:
+            names.append(name)
+            self._layer_data.append(flattened)
+            owner = self._owner
+            resolved = self._resolved
+            for i, item in enumerate(flattened):
+                if item is not None:
+                    owner[i] = name
+                    resolved[i] = item
+        self._cache = None
+        self._cache_rows = None
+        self._generation += 1
 
     def remove_layer(self, name: str) -> None:
         """Removes a layer from the map.
 
         :param name: The name of the layer.
         """
-        self._layers.pop(name)
+        names = self._layer_names
+        try:
+            index = names.index(name)
+        except ValueError:
+            raise KeyError(name) from None
+        names.pop(index)
+        layer_data = self._layer_data
+        layer_data.pop(index)
+        layer_count = len(layer_data)
+        owner = self._owner
+        resolved = self._resolved
+        for i, owner_name in enumerate(owner):
+            if owner_name != name:
+                continue
+            owner[i] = None
+            resolved[i] = None
+            for j in range(layer_count):
+                item = layer_data[j][i]
+                if item is not None:
+                    owner[i] = names[j]
+                    resolved[i] = item
+        self._cache = None
+        self._cache_rows = None
+        self._generation += 1
+
+    def _recompose(self) -> None:
+        """Rebuilds the composed state from all layers bottom to top."""
+        owner = self._owner
+        resolved = self._resolved
+        # The index writes into both parallel buffers, so a plain range is
+        # clearer and cheaper than enumerating one of them.
+        for i in range(len(resolved)):  # pylint: disable=consider-using-enumerate
+            owner[i] = None
+            resolved[i] = None
+        for name, layer in zip(self._layer_names, self._layer_data):
+            for i, item in enumerate(layer):
+                if item is not None:
+                    owner[i] = name
+                    resolved[i] = item
 
     def __getitem__(self, key: int) -> tuple:
         if not 0 <= key < self.height:
             raise IndexError()
-        row = [None for _ in range(self.width)]
-        layers = list(self._layers.values())
-        for layer in reversed(layers):
-            for i, item in enumerate(layer[key]):
-                if item is not None and row[i] is None:
-                    row[i] = item
-        return tuple(row)
+        return self.immutable[key]
 
     def __len__(self) -> int:
         return self.height
@@ -126,11 +249,13 @@ def dirname(path: str) -> str:
     :param path: The path
     :returns: The directory component of the path.
     """
-    index = path.rfind(os.sep) + 1
+    index = path.rfind(os.sep)
     if index < 0:
-        return path
-    directory = path[:index]
-    if directory == os.sep * len(directory):
+        return ""
+    directory = path[: index + 1]
+    # Counting the separators detects an all-separator prefix - the root -
+    # without building a throwaway comparison string of the same length.
+    if directory.count(os.sep) == len(directory):
         return directory
     return directory.rstrip(os.sep)
 
@@ -145,22 +270,16 @@ def hsv_to_rgb(hue: float, saturation: float, value: float) -> tuple:
               are located between 0 and 1.
     """
     # See https://en.wikipedia.org/wiki/HSL_and_HSV#HSV_to_RGB
+    # The sextant selects the components from a lookup table, which keeps the
+    # function straight-line instead of walking up to six comparisons.
     root_color = hue * 6.0
     chroma = value * saturation
     base = value - chroma
     supplement = chroma * (1 - abs(root_color % 2 - 1))
-    root_color = int(root_color)
-    if root_color == 0:
-        return (chroma + base, supplement + base, base)
-    if root_color == 1:
-        return (supplement + base, chroma + base, base)
-    if root_color == 2:
-        return (base, chroma + base, supplement + base)
-    if root_color == 3:
-        return (base, supplement + base, chroma + base)
-    if root_color == 4:
-        return (supplement + base, base, chroma + base)
-    return (chroma + base, base, supplement + base)
+    components = (chroma + base, supplement + base, base)
+    red, green, blue = _HSV_ORDER[int(root_color)]
+
+    return (components[red], components[green], components[blue])
 
 
 def pack_rgb(red: float, green: float, blue: float) -> int:
@@ -187,4 +306,19 @@ def hsv_to_packed_rgb(hue: float, saturation: float, value: float) -> int:
     :param value: The value of the color between 0 and 1.
     :returns: The color as integer between 0 and 0xFFFFFF
     """
-    return pack_rgb(*hsv_to_rgb(hue, saturation, value))
+    # Branchless formulation: each channel is a clamped triangle wave over
+    # the hue, blended towards white by the saturation.  This avoids the
+    # six-way sextant dispatch of hsv_to_rgb.
+    root_color = hue * 6.0
+    red = abs(root_color - 3.0) - 1.0
+    green = 2.0 - abs(root_color - 2.0)
+    blue = 2.0 - abs(root_color - 4.0)
+    red = max(0.0, min(1.0, red))
+    green = max(0.0, min(1.0, green))
+    blue = max(0.0, min(1.0, blue))
+    base = 1.0 - saturation
+    return (
+        (int(0xFF * value * (base + saturation * red)) << 16)
+        + (int(0xFF * value * (base + saturation * green)) << 8)
+        + int(0xFF * value * (base + saturation * blue))
+    )